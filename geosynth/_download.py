@@ -1,22 +1,206 @@
+import contextlib
+import os
+import threading
 import zipfile
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional
 from urllib.error import HTTPError
 
 from rich import print
 from rich.progress import Progress
 
+from ._stream_unzip import _sanitize_name
 from .common import DEFAULT_DATASET_PATH, PathLike
-from .data import Data
+from .data import Data, _parse_variant
 from .progress import UrlRetrieveProgressBar
 
+_VALID_DTYPES = frozenset(Data)
+_NON_HDR_DTYPES = tuple(x for x in Data if "hdr_" not in x)
+
 
 def _validate_dtypes(dtypes: Iterable):
-    for dtype in dtypes:
-        if dtype not in Data:
+    invalid = frozenset(dtypes) - _VALID_DTYPES
+    if invalid:
+        raise ValueError(
+            f"Specified dtypes {sorted(invalid)} are invalid. "
+            f"Must be one of: {sorted(_VALID_DTYPES)}."
+        )
+
+
+def _make_member_dirs(members: Iterable[str], path: Path) -> List[str]:
+    """Create the directories of all zip members, checking each directory once.
+
+    Multiple threads may be extracting into the same scene folders, and
+    ``ZipFile.extract`` creates parent directories non-atomically, so they are all
+    created here up front. Member names are sanitized the same way
+    ``ZipFile.extract`` does, so that nothing is created outside of ``path``.
+
+    Returns
+    -------
+    list
+        File members that remain to be extracted.
+    """
+    dirs = set()
+    files = []
+    for member in members:
+        name = _sanitize_name(member)
+        if not name:
+            continue
+        target = path / name
+        if name.endswith("/"):
+            dirs.add(target)
+        else:
+            dirs.add(target.parent)
+            files.append(member)
+
+    root = path.resolve()
+    for directory in sorted(dirs):
+        try:
+            # Catches pre-existing symlinks pointing outside of ``path``.
+            directory.resolve().relative_to(root)
+        except ValueError as e:
             raise ValueError(
-                f'Specifided dtype "{dtype}" is invalid. Must be one of: {list(Data).sort()}.'
+                f'Zip member directory "{directory}" is outside of "{path}".'
+            ) from e
+        directory.mkdir(parents=True, exist_ok=True)
+
+    return files
+
+
+def _fadvise(fd: int, advice_name: str) -> None:
+    """Best-effort ``posix_fadvise`` over an entire file."""
+    advice = getattr(os, advice_name, None)
+    if advice is None:
+        return  # Not available on this platform (e.g. macOS, Windows).
+    with contextlib.suppress(OSError):
+        os.posix_fadvise(fd, 0, 0, advice)
+
+
+def _extract_zip(
+    zip_path: Path,
+    path: Path,
+    progress_bar: Optional[UrlRetrieveProgressBar] = None,
+    executor: Optional[Executor] = None,
+) -> None:
+    """Extract all members of a zip file using a pool of threads.
+
+    ``ZipFile`` objects are not safe to read from concurrently, so each
+    worker thread opens its own file descriptor and ``ZipFile`` handle.
+
+    Parameters
+    ----------
+    executor: Optional[Executor]
+        Pool to extract with, so that concurrent extractions share a bounded
+        number of threads. Defaults to a temporary pool of ``os.cpu_count()`` threads.
+    """
+    with zipfile.ZipFile(zip_path, "r") as f:
+        members = f.namelist()
+
+    if progress_bar:
+        progress_bar.update(total=len(members), completed=0)
+
+    files = _make_member_dirs(members, path)
+    if progress_bar:
+        progress_bar.update(completed=len(members) - len(files))
+
+    local = threading.local()
+    files_opened = []  # ``ZipFile`` does not close file objects passed to it.
+    handles = []
+
+    def extract(member: str) -> None:
+        f = getattr(local, "f", None)
+        if f is None:
+            fd = os.open(zip_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            _fadvise(fd, "POSIX_FADV_SEQUENTIAL")
+            fp = os.fdopen(fd, "rb")
+            files_opened.append(fp)
+            f = local.f = zipfile.ZipFile(fp, "r")
+            handles.append(f)
+        f.extract(member, path=path)
+
+    with contextlib.ExitStack() as stack:
+        if executor is None:
+            executor = stack.enter_context(
+                ThreadPoolExecutor(max_workers=os.cpu_count())
             )
+        futures = []
+        try:
+            futures.extend(executor.submit(extract, member) for member in files)
+            for future in as_completed(futures):
+                future.result()
+                if progress_bar:
+                    progress_bar.update(advance=1)
+        finally:
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            if files_opened:
+                # Zip contents won't be read again; free up the page cache.
+                _fadvise(files_opened[0].fileno(), "POSIX_FADV_DONTNEED")
+            for f in handles:
+                f.close()
+            for fp in files_opened:
+                fp.close()
+
+
+def _download_and_extract(
+    dtype: str,
+    dst: Path,
+    variant: str,
+    force: bool,
+    cleanup: bool,
+    progress_bar: Optional[UrlRetrieveProgressBar],
+    executor: Optional[Executor] = None,
+) -> None:
+    """Download and extract a single dtype; intended to be run in a worker thread."""
+    zip_path = dst / str(_parse_variant(variant)) / f"{dtype}.zip"
+    # A zip kept by a previous ``cleanup=False`` call is extracted (and then
+    # cleaned up) rather than re-downloaded.
+    has_cached_zip = not force and zip_path.exists() and zip_path.stat().st_size > 0
+
+    try:
+        if cleanup and not has_cached_zip:
+            # Extract while downloading; the zip file never touches disk.
+            Data[dtype].download_and_extract_stream(
+                dst,
+                variant=variant,
+                force=force,
+                reporthook=progress_bar,
+            )
+            zip_path = None
+        else:
+            zip_path = Data[dtype].download_zip(
+                dst,
+                variant=variant,
+                force=force,
+                reporthook=progress_bar,
+            )
+    except HTTPError as e:
+        http_error_code = e.getcode()
+        if http_error_code == 404:
+            print(
+                f'[bold red]{dtype} for variant "{variant}" has not been uploaded yet.\n'
+                "    Please check back later.[/bold red]"
+            )
+        else:
+            raise
+
+        if progress_bar:
+            progress_bar.stop(f"[bold red]{dtype} Unavailable.[/bold red]")
+
+        return
+
+    if zip_path is not None and zip_path.stat().st_size:
+        if progress_bar:
+            progress_bar.update(description=f"{dtype} extracting")
+        _extract_zip(zip_path, dst / variant, progress_bar, executor)
+        if cleanup:
+            zip_path.unlink()
+            zip_path.touch()  # So that subsequent download calls know to not download.
+
+    if progress_bar:
+        progress_bar.update(description=f"{dtype} complete")
 
 
 def download(
@@ -61,9 +245,12 @@ def download(
 
     if not dtypes or "non-hdr" in dtypes:
         # All non-hdr types
-        dtypes = [x for x in Data if "hdr_" not in x]
+        dtypes = list(_NON_HDR_DTYPES)
     elif "all" in dtypes:
         dtypes = list(Data)
+    else:
+        # Remove duplicates (preserving order); each dtype gets its own worker.
+        dtypes = list(dict.fromkeys(dtypes))
 
     _validate_dtypes(dtypes)
 
@@ -76,48 +263,25 @@ def download(
                 progress, f"{dtype} downloading"
             )
 
-    for dtype in dtypes:
-        try:
-            zip_path = Data[dtype].download_zip(
+    max_workers = min(len(dtypes), 8) or 1
+    # Extraction of all dtypes shares one pool, bounding the total number of threads.
+    with ThreadPoolExecutor(
+        max_workers=os.cpu_count()
+    ) as extract_executor, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _download_and_extract,
+                dtype,
                 dst,
-                variant=variant,
-                force=force,
-                reporthook=progress_bars.get(dtype),
+                variant,
+                force,
+                cleanup,
+                progress_bars.get(dtype),
+                extract_executor,
             )
-        except HTTPError as e:
-            http_error_code = e.getcode()
-            if http_error_code == 404:
-                print(
-                    f'[bold red]{dtype} for variant "{variant}" has not been uploaded yet.\n'
-                    "    Please check back later.[/bold red]"
-                )
-            else:
-                raise
-
-            if progress:
-                progress_bars[dtype].stop(f"[bold red]{dtype} Unavailable.[/bold red]")
-
-            continue
-
-        progress_bar = progress_bars.get(dtype)
-        if zip_path.stat().st_size:
-            with zipfile.ZipFile(zip_path, "r") as f:
-                if progress_bar:
-                    progress_bar.update(
-                        description=f"{dtype} extracting",
-                        total=len(f.namelist()),
-                        completed=0,
-                    )
-                for member in f.namelist():
-                    f.extract(member, path=dst / variant)
-                    if progress_bar:
-                        progress_bar.update(advance=1)
-
-            if cleanup:
-                zip_path.unlink()
-                zip_path.touch()  # So that subsequent download calls know to not download.
-
-        if progress_bar:
-            progress_bar.update(description=f"{dtype} complete")
+            for dtype in dtypes
+        ]
+        for future in as_completed(futures):
+            future.result()  # Re-raise any non-404 exception from the worker.
 
     return dst / variant
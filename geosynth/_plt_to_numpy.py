@@ -1,9 +1,30 @@
-import io
+import functools
+import os
+import sys
+from types import SimpleNamespace
 
-import cv2
 import numpy as np
 
 
+@functools.lru_cache(maxsize=None)
+def _mpl() -> SimpleNamespace:
+    """Lazily import the required matplotlib components.
+
+    Selects the non-interactive ``"Agg"`` backend to skip GUI backend probing,
+    unless ``matplotlib.pyplot`` has already been imported or a backend was
+    explicitly specified via the ``MPLBACKEND`` environment variable.
+    """
+    import matplotlib
+
+    if "matplotlib.pyplot" not in sys.modules and "MPLBACKEND" not in os.environ:
+        matplotlib.use("Agg", force=False)
+
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
+    return SimpleNamespace(plt=plt, LineCollection=LineCollection)
+
+
 def plt_to_numpy(close=True, axis_off=True, dpi=100):
     """Convert matplotlib state to numpy array.
 
@@ -28,7 +49,7 @@ def plt_to_numpy(close=True, axis_off=True, dpi=100):
     arr: numpy.ndarray
         Plotted image.
     """
-    import matplotlib.pyplot as plt
+    plt = _mpl().plt
 
     if axis_off:
         plt.subplots_adjust(left=0, right=1, bottom=0, top=1)
@@ -37,19 +58,22 @@ def plt_to_numpy(close=True, axis_off=True, dpi=100):
         ax.get_xaxis().set_visible(False)
         ax.get_yaxis().set_visible(False)
 
-    with io.BytesIO() as f:
-        plt.savefig(
-            f,
-            bbox_inches="tight",
-            transparent="True",
-            pad_inches=0,
-            dpi=dpi,
-            format="png",
-        )
-        if close:
-            plt.close()
-        f.seek(0)
-        arr = cv2.imdecode(np.frombuffer(f.read(), np.uint8), cv2.IMREAD_UNCHANGED)
-        arr = cv2.cvtColor(arr, cv2.COLOR_BGR2RGB)
-
-    return arr[..., :3]  # Remove alpha channel
+    fig = plt.gcf()
+    fig.set_dpi(dpi)
+    fig.canvas.draw()
+    renderer = fig.canvas.get_renderer()  # pyright: ignore[reportGeneralTypeIssues]
+    h, w = int(renderer.height), int(renderer.width)
+    buf = fig.canvas.buffer_rgba()  # pyright: ignore[reportGeneralTypeIssues]
+    arr = np.asarray(buf).reshape(h, w, 4)
+
+    # Equivalent of ``bbox_inches="tight"``.
+    # Display coordinates have their origin at the bottom-left.
+    bbox = fig.get_tightbbox(renderer).transformed(fig.dpi_scale_trans)
+    x0, x1 = max(int(np.floor(bbox.x0)), 0), min(int(np.ceil(bbox.x1)), w)
+    y0, y1 = max(int(np.floor(h - bbox.y1)), 0), min(int(np.ceil(h - bbox.y0)), h)
+    arr = arr[y0:y1, x0:x1, :3].copy()  # Remove alpha channel
+
+    if close:
+        plt.close()
+
+    return arr
@@ -0,0 +1,249 @@
+"""Extract zip members from a non-seekable stream (e.g. an HTTP response).
+
+Only the local file headers are used; the central directory at the end of the
+archive is never read. This allows members to be extracted while the archive
+is still being downloaded.
+"""
+
+import struct
+import zlib
+from pathlib import PurePosixPath
+from typing import BinaryIO, Callable, Iterator, Optional, Tuple
+
+_LOCAL_FILE_HEADER_SIGNATURE = 0x04034B50
+_DATA_DESCRIPTOR_SIGNATURE = 0x08074B50
+_CENTRAL_DIRECTORY_SIGNATURES = (
+    0x02014B50,  # Central directory file header.
+    0x06054B50,  # End of central directory record (archive without members).
+    0x06064B50,  # Zip64 end of central directory record.
+)
+_LOCAL_FILE_HEADER = struct.Struct("<IHHHHHIIIHH")
+_ZIP64_EXTRA_ID = 0x0001
+_ZIP64_SENTINEL = 0xFFFFFFFF
+
+_FLAG_ENCRYPTED = 1 << 0
+_FLAG_DATA_DESCRIPTOR = 1 << 3
+_FLAG_UTF8 = 1 << 11
+
+_METHOD_STORED = 0
+_METHOD_DEFLATED = 8
+
+
+class StreamUnzipError(Exception):
+    """Archive cannot be extracted from a stream."""
+
+
+class _Reader:
+    """Buffered reader over a file-like object that supports pushing data back."""
+
+    def __init__(
+        self,
+        fileobj: BinaryIO,
+        chunk_size: int,
+        on_read: Optional[Callable[[int], None]] = None,
+    ):
+        self.fileobj = fileobj
+        self.chunk_size = chunk_size
+        self.on_read = on_read
+        self.buffer = b""
+
+    def read_chunk(self, max_size: Optional[int] = None) -> bytes:
+        if max_size is None:
+            max_size = self.chunk_size
+        if not self.buffer:
+            # Always read full chunks so that small header reads are served from
+            # the buffer instead of issuing many tiny reads on ``fileobj``.
+            self.buffer = self.fileobj.read(self.chunk_size)
+            if self.on_read is not None and self.buffer:
+                self.on_read(len(self.buffer))
+        out, self.buffer = self.buffer[:max_size], self.buffer[max_size:]
+        return out
+
+    def read_exact(self, size: int) -> bytes:
+        out = bytearray()
+        while len(out) < size:
+            chunk = self.read_chunk(size - len(out))
+            if not chunk:
+                raise StreamUnzipError("Unexpected end of archive.")
+            out += chunk
+        return bytes(out)
+
+    def unread(self, data: bytes) -> None:
+        self.buffer = data + self.buffer
+
+
+def _sanitize_name(name: str) -> str:
+    """Strip absolute and parent references, similar to ``ZipFile.extract``."""
+    parts = [
+        x
+        for x in PurePosixPath(name.replace("\\", "/")).parts
+        if x not in ("/", ".", "..")
+    ]
+    out = "/".join(parts)
+    if name.endswith("/") and out:
+        out += "/"
+    return out
+
+
+def _parse_zip64_extra(extra: bytes, compressed_size: int, uncompressed_size: int):
+    offset = 0
+    while offset + 4 <= len(extra):
+        header_id, size = struct.unpack_from("<HH", extra, offset)
+        offset += 4
+        if header_id == _ZIP64_EXTRA_ID:
+            field = extra[offset : offset + size]
+            field_offset = 0
+            if uncompressed_size == _ZIP64_SENTINEL:
+                (uncompressed_size,) = struct.unpack_from("<Q", field, field_offset)
+                field_offset += 8
+            if compressed_size == _ZIP64_SENTINEL:
+                (compressed_size,) = struct.unpack_from("<Q", field, field_offset)
+            return True, compressed_size, uncompressed_size
+        offset += size
+    return False, compressed_size, uncompressed_size
+
+
+def _iter_known_size(reader: _Reader, size: int) -> Iterator[bytes]:
+    remaining = size
+    while remaining:
+        chunk = reader.read_chunk(remaining)
+        if not chunk:
+            raise StreamUnzipError("Unexpected end of archive.")
+        remaining -= len(chunk)
+        yield chunk
+
+
+def _iter_member(
+    reader: _Reader,
+    method: int,
+    flags: int,
+    crc: int,
+    compressed_size: int,
+    zip64: bool,
+) -> Iterator[bytes]:
+    has_data_descriptor = bool(flags & _FLAG_DATA_DESCRIPTOR)
+    actual_crc = 0
+
+    if method == _METHOD_STORED:
+        if has_data_descriptor:
+            raise StreamUnzipError(
+                "Stored members with a trailing data descriptor cannot be streamed."
+            )
+        for chunk in _iter_known_size(reader, compressed_size):
+            actual_crc = zlib.crc32(chunk, actual_crc)
+            yield chunk
+    elif method == _METHOD_DEFLATED:
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        if has_data_descriptor:
+            # Compressed size is unknown; rely on the deflate stream's end marker.
+            while not decompressor.eof:
+                chunk = reader.read_chunk()
+                if not chunk:
+                    raise StreamUnzipError("Unexpected end of archive.")
+                out = decompressor.decompress(chunk)
+                if out:
+                    actual_crc = zlib.crc32(out, actual_crc)
+                    yield out
+            reader.unread(decompressor.unused_data)
+        else:
+            for chunk in _iter_known_size(reader, compressed_size):
+                out = decompressor.decompress(chunk)
+                if out:
+                    actual_crc = zlib.crc32(out, actual_crc)
+                    yield out
+        out = decompressor.flush()
+        if out:
+            actual_crc = zlib.crc32(out, actual_crc)
+            yield out
+    else:
+        raise StreamUnzipError(f"Unsupported compression method {method}.")
+
+    if has_data_descriptor:
+        (signature,) = struct.unpack("<I", reader.read_exact(4))
+        if signature != _DATA_DESCRIPTOR_SIGNATURE:
+            # The data descriptor signature is optional.
+            reader.unread(struct.pack("<I", signature))
+        (crc,) = struct.unpack("<I", reader.read_exact(4))
+        reader.read_exact(16 if zip64 else 8)  # Compressed & uncompressed sizes.
+
+    if actual_crc != crc:
+        raise StreamUnzipError("Bad CRC-32 for member.")
+
+
+def stream_unzip(
+    fileobj: BinaryIO,
+    chunk_size: int = 1 << 16,
+    on_read: Optional[Callable[[int], None]] = None,
+) -> Iterator[Tuple[str, Iterator[bytes]]]:
+    """Iterate over the members of a zip archive as it is being read.
+
+    Each member's chunks **must** be fully consumed before advancing
+    to the next member.
+    The central directory itself is not read; iteration stops at its start.
+
+    Raises
+    ------
+    StreamUnzipError
+        If the archive is truncated, corrupt, or uses unsupported features.
+
+    Parameters
+    ----------
+    fileobj: BinaryIO
+        Readable file-like object; does not need to be seekable.
+    chunk_size: int
+        Number of bytes to read from ``fileobj`` at a time.
+    on_read: Optional[Callable[[int], None]]
+        Called with the number of bytes read from ``fileobj`` after every read.
+
+    Yields
+    ------
+    name: str
+        Sanitized relative member name. Directories end with ``"/"``.
+    chunks: Iterator[bytes]
+        Uncompressed member contents.
+    """
+    reader = _Reader(fileobj, chunk_size, on_read=on_read)
+    while True:
+        # Running out of data before the central directory means the archive
+        # is truncated (e.g. a dropped connection); ``read_exact`` raises.
+        signature_bytes = reader.read_exact(4)
+        (signature,) = struct.unpack("<I", signature_bytes)
+        if signature in _CENTRAL_DIRECTORY_SIGNATURES:
+            # All members have been extracted.
+            return
+        if signature != _LOCAL_FILE_HEADER_SIGNATURE:
+            raise StreamUnzipError(
+                f"Unexpected zip record signature 0x{signature:08X}."
+            )
+
+        header = signature_bytes + reader.read_exact(_LOCAL_FILE_HEADER.size - 4)
+        (
+            _signature,
+            _version,
+            flags,
+            method,
+            _mtime,
+            _mdate,
+            crc,
+            compressed_size,
+            uncompressed_size,
+            name_length,
+            extra_length,
+        ) = _LOCAL_FILE_HEADER.unpack(header)
+
+        if flags & _FLAG_ENCRYPTED:
+            raise StreamUnzipError("Encrypted members are not supported.")
+
+        name_bytes = reader.read_exact(name_length)
+        extra = reader.read_exact(extra_length)
+        name = name_bytes.decode("utf-8" if flags & _FLAG_UTF8 else "cp437")
+        zip64, compressed_size, uncompressed_size = _parse_zip64_extra(
+            extra, compressed_size, uncompressed_size
+        )
+
+        chunks = _iter_member(reader, method, flags, crc, compressed_size, zip64)
+        yield _sanitize_name(name), chunks
+
+        # Drain any unconsumed data so the reader is positioned at the next header.
+        for _ in chunks:
+            pass
@@ -1,22 +1,37 @@
 import errno
 import json
 import os
+import struct
+import urllib.error
 import urllib.request
+import zipfile
 from abc import abstractmethod
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Optional, Protocol, Union
+from typing import Any, BinaryIO, Dict, Optional, Protocol, Tuple, Union
 
 import cv2
 import numpy as np
 from autoregistry import Registry
 
+try:
+    import OpenEXR
+except ImportError:  # pragma: no cover
+    OpenEXR = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+from ._stream_unzip import stream_unzip
 from ._visualize_instances import visualize_instances
 from .common import PathLike
 from .mappings import SemanticClassesMixin, apply_palette, to_uint8, turbo
 from .models.lighting import Lighting as LightingModel
 
 _DOWNLOAD_PREFIX = "https://storage.googleapis.com/geomagical-geosynth-public"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
 
 
 class OpenCVSaveError(Exception):
@@ -48,11 +63,25 @@ class DatasetVariant(str, Enum):
         return self.value
 
 
+def _parse_variant(variant: str) -> DatasetVariant:
+    variant = variant.lower()
+    try:
+        return DatasetVariant[variant]
+    except KeyError as e:
+        raise ValueError(
+            f'Variant "{variant}" not in valid. Choose one of: '
+            f"{[x.value for x in DatasetVariant]}."
+        ) from e
+
+
 class Data(Registry, snake_case=True):
     """Abstract Base Class for all data types."""
 
     ext: str
 
+    # Extensions of previously used file formats that ``read_file`` still supports.
+    legacy_exts: Tuple[str, ...] = ()
+
     @classmethod
     @abstractmethod
     def read_file(cls, fn: Path):
@@ -82,9 +111,17 @@ class Data(Registry, snake_case=True):
 
     @property
     def path(self) -> Path:
-        """Path to file on-disk."""
-        ext = self.ext
-        return self.scene_path / (self.stem + ext)
+        """Path to file on-disk.
+
+        Falls back to a legacy file format if only that exists on-disk.
+        """
+        path = self.scene_path / (self.stem + self.ext)
+        if self.legacy_exts and not path.exists():
+            for ext in self.legacy_exts:
+                legacy_path = path.with_suffix(ext)
+                if legacy_path.exists():
+                    return legacy_path
+        return path
 
     def exists(self) -> bool:
         """Whether or not the file exists on-disk."""
@@ -104,7 +141,9 @@ class Data(Registry, snake_case=True):
 
     def write(self, data: Any, *args, **kwargs) -> None:
         self.scene_path.mkdir(parents=True, exist_ok=True)
-        return self.write_file(self.path, data, *args, *kwargs)
+        # Always write the current file format, never a legacy one.
+        path = self.scene_path / (self.stem + self.ext)
+        return self.write_file(path, data, *args, **kwargs)
 
     @classmethod
     def download_zip(
@@ -137,16 +176,7 @@ class Data(Registry, snake_case=True):
         Path
             Path to local zip file.
         """
-        # Argument Preprocessing
-        variant = variant.lower()
-        try:
-            variant = DatasetVariant[variant]
-        except KeyError as e:
-            raise ValueError(
-                f'Variant "{variant}" not in valid. Choose one of: '
-                f"{[x.value for x in DatasetVariant]}."
-            ) from e
-
+        variant = _parse_variant(variant)
         output_dir = Path(output_dir).expanduser() / str(variant.value)
         output_dir.mkdir(exist_ok=True, parents=True)
 
@@ -170,22 +200,139 @@ class Data(Registry, snake_case=True):
 
         return zip_path
 
+    @classmethod
+    def download_and_extract_stream(
+        cls,
+        output_dir: PathLike,
+        variant: str = "full",
+        force: bool = False,
+        reporthook: Optional[UrlRetrieveReportHook] = None,
+    ) -> Path:
+        """Download a GeoSynth variant zip file, extracting members as they arrive.
+
+        Unlike ``download_zip``, the zip file is never written to disk.
+        Instead, an empty placeholder zip file is left behind so that subsequent
+        calls know to not re-download. A non-empty zip file previously downloaded
+        by ``download_zip`` is not extracted; it is re-downloaded and replaced.
+
+        Parameters
+        ----------
+        output_dir: PathLike
+            Output folder to download contents to.
+            If it doesn't exist, it will be created.
+        variant: str
+            Variant of GeoSynth to download.
+            A variant subfolder in ``output_dir`` will be created.
+            Defaults to ``"full"``.
+        force: bool
+            Force a redownload, despite cached files.
+            Defaults to ``False``.
+        reporthook: Optional[UrlRetrieveReportHook]
+            Optional callable with the same semantics as ``urlretrieve``'s.
+            Commonly used for progress updates.
+
+        Returns
+        -------
+        Path
+            Path to the variant folder the contents were extracted to.
+        """
+        variant = _parse_variant(variant)
+        output_dir = Path(output_dir).expanduser() / str(variant.value)
+        output_dir.mkdir(exist_ok=True, parents=True)
+
+        zip_name = f"{cls.__registry__.name}.zip"
+        zip_path = output_dir / zip_name
+
+        if not force and zip_path.exists() and zip_path.stat().st_size == 0:
+            if reporthook:
+                reporthook(1, 1, 1)  # Will set reporthook to done.
+            return output_dir
+
+        zip_url = f"{_DOWNLOAD_PREFIX}/{variant.value}/{zip_name}"
+        with urllib.request.urlopen(zip_url) as response:  # noqa: S310
+            total_size = int(response.headers.get("Content-Length", -1))
+            block_size = 1 << 16
+            bytes_read = 0
+
+            def on_read(size: int) -> None:
+                # ``urlretrieve``'s reporthook calling convention, but reads may be
+                # shorter than ``block_size``, so report a single block of all
+                # bytes read so far.
+                nonlocal bytes_read
+                bytes_read += size
+                if reporthook:
+                    reporthook(1, bytes_read, total_size)
+
+            if reporthook:
+                reporthook(0, block_size, total_size)
+
+            for name, chunks in stream_unzip(
+                response, chunk_size=block_size, on_read=on_read
+            ):
+                if not name:
+                    continue
+                member_path = output_dir / name
+                if name.endswith("/"):
+                    member_path.mkdir(parents=True, exist_ok=True)
+                    continue
+                member_path.parent.mkdir(parents=True, exist_ok=True)
+                member_path_tmp = member_path.with_name(member_path.name + ".tmp")
+                with member_path_tmp.open("wb") as f:
+                    for chunk in chunks:
+                        f.write(chunk)
+                member_path_tmp.replace(member_path)
+
+            # Read the remaining central directory, so the total size can be checked.
+            while True:
+                chunk = response.read(block_size)
+                if not chunk:
+                    break
+                on_read(len(chunk))
+
+        if total_size >= 0 and bytes_read != total_size:
+            # Same exception as ``urlretrieve``.
+            raise urllib.error.ContentTooShortError(
+                f"retrieval incomplete: got only {bytes_read} out of {total_size} bytes",
+                None,  # pyright: ignore[reportGeneralTypeIssues]
+            )
+
+        # Replace any previously downloaded zip file with an empty placeholder,
+        # so that subsequent download calls know to not download.
+        zip_path.unlink(missing_ok=True)
+        zip_path.touch()
+        return output_dir
+
 
 class PngMixin:
     ext = ".png"
 
     @classmethod
-    def read_file(cls, fn: Path) -> np.ndarray:
+    def read_file(cls, fn: Path, contiguous: bool = True) -> np.ndarray:
         """Read a png file.
 
+        Parameters
+        ----------
+        contiguous: bool
+            If ``True``, convert OpenCV's BGR(A) buffer to RGB(A) in-place.
+            If ``False``, RGB images are instead returned as a channel-reversed
+            (negative-stride) view, avoiding the conversion. Such views are not
+            accepted by some consumers, like OpenCV drawing functions or
+            ``torch.from_numpy``. RGBA images are always converted in-place.
+            Defaults to ``True``.
+
         Returns
         -------
         np.ndarray
-            (H, W, 3) RGB or (H, W) grayscale image.
+            (H, W, 3) RGB, (H, W, 4) RGBA, or (H, W) grayscale image.
         """
         img = cv2.imread(str(fn), cv2.IMREAD_UNCHANGED)
         if img.ndim == 3:
-            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+            if img.shape[-1] == 4:
+                cv2.cvtColor(img, cv2.COLOR_BGRA2RGBA, dst=img)
+            elif contiguous:
+                cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=img)
+            else:
+                img = img[..., ::-1]
         return img
 
     @classmethod
@@ -195,33 +342,132 @@ class PngMixin:
         Parameters
         ----------
         data: np.ndarray
-            (H, W, 3) RGB uint8 image.
+            (H, W, 3) RGB, (H, W, 4) RGBA, or (H, W) grayscale uint8 image.
         """
         if data.ndim == 3:
-            data = cv2.cvtColor(data, cv2.COLOR_RGB2BGR)
+            if data.shape[-1] == 4:
+                data = cv2.cvtColor(data, cv2.COLOR_RGBA2BGRA)
+            else:
+                data = data[..., ::-1]  # RGB -> BGR view
         cv2.imwrite(str(fn), data)
 
 
+def _read_npy(f: BinaryIO) -> np.ndarray:
+    """Read a ``.npy`` member of a npz file, optionally zstd-compressed."""
+    magic = f.read(len(_ZSTD_MAGIC))
+    f.seek(0)
+    if magic == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise ImportError(
+                "Reading zstd-compressed npz files requires the ``zstandard`` package."
+            )
+        f = zstandard.ZstdDecompressor().stream_reader(f)
+    return np.lib.format.read_array(f, allow_pickle=False)
+
+
+def _memmap_npy(fn: Path, zinfo: zipfile.ZipInfo) -> Optional[np.ndarray]:
+    """Memory-map an uncompressed ``.npy`` member of a npz file.
+
+    Returns ``None`` if the member cannot be memory-mapped.
+    """
+    if zinfo.compress_type != zipfile.ZIP_STORED:
+        return None
+
+    with fn.open("rb") as f:
+        # Skip over the member's local file header.
+        f.seek(zinfo.header_offset)
+        local_header = f.read(30)
+        name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+        f.seek(zinfo.header_offset + 30 + name_length + extra_length)
+
+        if f.read(len(_ZSTD_MAGIC)) == _ZSTD_MAGIC:
+            return None
+        f.seek(-len(_ZSTD_MAGIC), os.SEEK_CUR)
+
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        else:
+            return None
+        offset = f.tell()
+
+    if dtype.hasobject or not shape or 0 in shape:
+        return None
+
+    return np.memmap(
+        fn,
+        dtype=dtype,
+        mode="r",
+        offset=offset,
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
+
+
 class NpzMixin:
     """Stores/Reads npz data as-is."""
 
     ext = ".npz"
 
+    compression: str = "deflate"
+    """Default compression used when writing; either ``"deflate"`` or ``"zstd"``.
+
+    ``"deflate"`` uses zlib (level 3) and is readable by ``np.load``.
+    ``"zstd"`` compresses each array with zstandard (level 3) and stores it
+    in an uncompressed zip container. It is faster and produces smaller files,
+    but the resulting file cannot be read by a stock ``np.load``.
+    Requires the ``zstandard`` package; it is never silently substituted, so the
+    written format does not depend on the installed packages.
+    """
+
     @classmethod
-    def read_file(cls, fn: Path) -> Union[Dict[str, np.ndarray], np.ndarray]:
-        with np.load(fn) as data:
-            data: Dict[str, np.ndarray] = dict(data)
-            if len(data) == 1:
-                return list(data.values())[0]
-            else:
-                return data
+    def read_file(
+        cls, fn: Path, mmap: bool = False
+    ) -> Union[Dict[str, np.ndarray], np.ndarray]:
+        """Read a npz file.
+
+        Parameters
+        ----------
+        mmap: bool
+            Memory-map arrays instead of reading them into memory.
+            Only arrays stored uncompressed (e.g. via ``np.savez``) can be
+            memory-mapped; compressed arrays are read as usual.
+            Defaults to ``False``.
+        """
+        data: Dict[str, np.ndarray] = {}
+        with zipfile.ZipFile(fn) as zf:
+            for zinfo in zf.infolist():
+                name = zinfo.filename
+                key = name[: -len(".npy")] if name.endswith(".npy") else name
+                if mmap:
+                    arr = _memmap_npy(fn, zinfo)
+                    if arr is not None:
+                        data[key] = arr
+                        continue
+                with zf.open(zinfo) as f:
+                    data[key] = _read_npy(f)
+        if len(data) == 1:
+            return list(data.values())[0]
+        else:
+            return data
 
     @classmethod
     def write_file(
         cls,
         fn: Path,
         data: Union[Dict[str, np.ndarray], np.ndarray],
+        compression: Optional[str] = None,
     ) -> None:
+        """Write a npz file.
+
+        Parameters
+        ----------
+        compression: Optional[str]
+            Either ``"deflate"`` or ``"zstd"``.
+            Defaults to the class's ``compression`` attribute.
+        """
         if isinstance(data, dict):
             pass
         elif isinstance(data, np.ndarray):
@@ -231,27 +477,69 @@ class NpzMixin:
             }
         else:
             raise TypeError
-        np.savez_compressed(fn, **data)
+
+        if compression is None:
+            compression = cls.compression
+        if compression == "deflate":
+            zip_compression = zipfile.ZIP_DEFLATED
+            compressor = None
+        elif compression == "zstd":
+            if zstandard is None:
+                raise ImportError(
+                    "Writing zstd compressed npz files requires the ``zstandard`` package."
+                )
+            zip_compression = zipfile.ZIP_STORED
+            compressor = zstandard.ZstdCompressor(level=3)
+        else:
+            raise ValueError(f'Unknown compression "{compression}".')
+
+        # Arrays are streamed into the compressor, so the full serialized
+        # array is never held in memory (unlike ``np.savez_compressed``).
+        with zipfile.ZipFile(fn, "w", zip_compression, compresslevel=3) as zf:
+            for key, value in data.items():
+                value = np.asanyarray(value)
+                with zf.open(f"{key}.npy", "w", force_zip64=True) as f:
+                    if compressor is None:
+                        np.lib.format.write_array(f, value, allow_pickle=False)
+                    else:
+                        with compressor.stream_writer(f) as writer:
+                            np.lib.format.write_array(writer, value, allow_pickle=False)
 
 
 class NpzFloat16Mixin(NpzMixin):
-    """Converts stored float16 -> float32 for easier standard processing."""
+    """Stores data as float16; optionally converts to another dtype on read."""
 
     @classmethod
-    def read_file(cls, fn: Path) -> Union[Dict[str, np.ndarray], np.ndarray]:
-        out = super().read_file(fn)
+    def read_file(
+        cls, fn: Path, dtype: Optional[np.dtype] = None, mmap: bool = False
+    ) -> Union[Dict[str, np.ndarray], np.ndarray]:
+        """Read a float16 npz file.
+
+        Parameters
+        ----------
+        dtype: Optional[np.dtype]
+            If provided, cast the float16 data to this dtype (e.g. ``np.float32``).
+            Defaults to returning the stored float16 data as-is.
+        mmap: bool
+            See ``NpzMixin.read_file``.
+        """
+        out = super().read_file(fn, mmap=mmap)
+        if dtype is None:
+            return out
         if isinstance(out, np.ndarray):
-            out = out.astype(np.float32)
+            out = out.astype(dtype)
         elif isinstance(out, dict):
-            out = {k: v.astype(np.float32) for k, v in out.items()}
+            out = {k: v.astype(dtype) for k, v in out.items()}
         else:
             raise TypeError
         return out
 
     @classmethod
-    def write_file(cls, fn: Path, data: np.ndarray) -> None:
+    def write_file(
+        cls, fn: Path, data: np.ndarray, compression: Optional[str] = None
+    ) -> None:
         data = data.astype(np.float16)
-        super().write_file(fn, data)
+        super().write_file(fn, data, compression=compression)
 
 
 class HdrMixin:
@@ -271,6 +559,59 @@ class HdrMixin:
             raise OpenCVSaveError
 
 
+def _openexr():
+    # OpenCV's OpenEXR codec is disabled by default (and its enabling environment
+    # variable is cached process-wide), so the standalone bindings are used instead.
+    if OpenEXR is None:
+        raise ImportError("Reading/writing exr files requires the ``OpenEXR`` package.")
+    return OpenEXR
+
+
+class ExrMixin:
+    """Half-precision, ZIP-compressed OpenEXR.
+
+    Stores half as many bytes per pixel as float32 data.
+    Legacy Radiance ``.hdr`` files can still be read.
+    """
+
+    ext = ".exr"
+    legacy_exts = (".hdr",)
+
+    @classmethod
+    def read_file(cls, fn: Path) -> np.ndarray:
+        """Read an exr (or legacy hdr) file.
+
+        Returns
+        -------
+        np.ndarray
+            (H, W, 3) float32 RGB image.
+        """
+        if Path(fn).suffix == ".hdr":
+            return HdrMixin.read_file(fn)
+
+        with _openexr().File(str(fn)) as f:
+            return f.channels()["RGB"].pixels.astype(np.float32)
+
+    @classmethod
+    def write_file(cls, fn: Path, data: np.ndarray) -> None:
+        """Write an exr file.
+
+        Parameters
+        ----------
+        data: np.ndarray
+            (H, W, 3) RGB image.
+            Values are clipped to the largest finite half-precision value (65504)
+            so that bright pixels are not stored as infinity.
+        """
+        exr = _openexr()
+        header = {"compression": exr.ZIP_COMPRESSION, "type": exr.scanlineimage}
+        half_max = np.finfo(np.float16).max
+        rgb = np.clip(data, -half_max, half_max)
+        channels = {"RGB": np.ascontiguousarray(rgb, dtype=np.float16)}
+        with exr.File(header, channels) as f:
+            f.write(str(fn))
+
+
 class JsonMixin:
     ext = ".json"
 
@@ -307,19 +648,19 @@ class HdrCubeEnvironmentMap(NpzMixin, Data):
     pass
 
 
-class HdrReflectance(HdrMixin, Data):
+class HdrReflectance(ExrMixin, Data):
     pass
 
 
-class HdrResidual(HdrMixin, Data):
+class HdrResidual(ExrMixin, Data):
     pass
 
 
-class HdrRgb(HdrMixin, Data):
+class HdrRgb(ExrMixin, Data):
     pass
 
 
-class HdrShading(HdrMixin, Data):
+class HdrShading(ExrMixin, Data):
     pass
 
 
@@ -353,13 +694,14 @@ class Lighting(JsonMixin, Data):
     @classmethod
     def read_file(cls, fn: Path) -> LightingModel:
         data = super().read_file(fn)
-        return LightingModel(**data)
+        return LightingModel.from_dict(data)
 
 
 class Normals(NpzFloat16Mixin, Data):
     @classmethod
     def visualize(cls, data) -> np.ndarray:
         """Visualize normals with RGB representing XYZ."""
+        data = data.astype(np.promote_types(data.dtype, np.float32), copy=False)
         return to_uint8(data / 2 + 0.5)
 
 
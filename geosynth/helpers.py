@@ -1,16 +1,106 @@
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
 
-def _first_last_nonzero(mask, axis):
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _row_any(mask, i, start, stop):
+        """Whether ``mask[i, start:stop]`` contains a nonzero."""
+        # Branch-free reduction over a contiguous slice so that LLVM can vectorize it.
+        row = mask[i, start:stop]
+        acc = False
+        for j in range(row.shape[0]):
+            acc |= row[j] != 0
+        return acc
+
+    @numba.njit(cache=True)
+    def _first_last_nonzero_rows(mask):
+        """First and last row containing a nonzero; ``(-1, -1)`` if empty."""
+        h, w = mask.shape
+        for first in range(h):
+            if _row_any(mask, first, 0, w):
+                break
+        else:
+            return -1, -1
+
+        for last in range(h - 1, first - 1, -1):
+            if _row_any(mask, last, 0, w):
+                break
+        return first, last
+
+    @numba.njit(cache=True)
+    def _first_last_true_cols(mask):
+        """First and last column containing a ``True``; ``(-1, -1)`` if empty."""
+        h, w = mask.shape
+        first, last = w, -1
+        for i in range(h):
+            # Only columns outside of the current extent need to be checked.
+            if _row_any(mask, i, 0, first):
+                for j in range(first):
+                    if mask[i, j]:
+                        first = j
+                        break
+            start = max(last, first - 1) + 1
+            if _row_any(mask, i, start, w):
+                for j in range(w - 1, start - 1, -1):
+                    if mask[i, j]:
+                        last = j
+                        break
+        if last < 0:
+            return -1, -1
+        return first, last
+
+
+def _first_last_nonzero(mask, axis) -> Optional[Tuple[int, int]]:
+    """First and last indices where ``mask.any(axis=axis)``; ``None`` if empty."""
     if mask.ndim != 2:
         raise ValueError
 
-    res = np.nonzero(mask.any(axis=axis))[0]
+    if numba is not None and mask.dtype == bool:
+        if axis == 1:
+            if mask.flags.c_contiguous and mask.shape[1] % 8 == 0:
+                # Check 8 pixels at a time.
+                first, last = _first_last_nonzero_rows(mask.view(np.uint64))
+            else:
+                first, last = _first_last_nonzero_rows(mask)
+        else:
+            first, last = _first_last_true_cols(mask)
+        if first < 0:
+            return None
+        return first, last
+
+    res = np.flatnonzero(mask.any(axis=axis))
+    if not res.size:
+        return None
     return res[0], res[-1]
 
 
+def _bboxes_vectorized(masks: np.ndarray) -> np.ndarray:
+    """Vectorized ``instance_bbox`` over a ``(N, H, W)`` stack of binary masks."""
+    if masks.ndim != 3:
+        raise ValueError
+
+    _, h, w = masks.shape
+    any_w = masks.any(axis=2)  # (N, H)
+    any_h = masks.any(axis=1)  # (N, W)
+
+    bboxes = np.empty((masks.shape[0], 4), dtype=np.float32)
+    bboxes[:, 0] = np.argmax(any_h, axis=1)
+    bboxes[:, 1] = np.argmax(any_w, axis=1)
+    bboxes[:, 2] = w - 1 - np.argmax(any_h[:, ::-1], axis=1)
+    bboxes[:, 3] = h - 1 - np.argmax(any_w[:, ::-1], axis=1)
+    bboxes /= np.array([w, h, w, h], dtype=np.float32)
+    bboxes[~any_w.any(axis=1)] = np.nan
+    return bboxes
+
+
 def instance_bbox(mask: np.ndarray) -> np.ndarray:
     """Compute the normalized inclusive bounding box for a binary mask.
 
@@ -27,10 +117,13 @@ def instance_bbox(mask: np.ndarray) -> np.ndarray:
         All values are in range ``[0, 1]``.
         If there are no ``True`` pixels, then all values are ``nan``.
     """
-    if mask.any():
-        h, w = mask.shape
-        top_left_y, bottom_right_y = _first_last_nonzero(mask, 1)
-        top_left_x, bottom_right_x = _first_last_nonzero(mask, 0)
+    h, w = mask.shape
+    rows = _first_last_nonzero(mask, 1)
+    if rows is not None:
+        top_left_y, bottom_right_y = rows
+        # Only rows within the bbox need to be scanned for columns.
+        cols = _first_last_nonzero(mask[top_left_y : bottom_right_y + 1], 0)
+        top_left_x, bottom_right_x = cols  # pyright: ignore[reportGeneralTypeIssues]
         bbox = np.array(
             [top_left_x, top_left_y, bottom_right_x, bottom_right_y],
             dtype=np.float32,
@@ -62,10 +155,7 @@ def instance_segmentation_bboxes(
         array where each row represents the normalized coordinates
         ``[top_left_x, top_left_y, bottom_right_x, bottom_right_y]``.
     """
-    bboxes = {}
-    for label, masks in instances_dict.items():
-        bboxes[label] = []
-        for mask in masks:
-            bboxes[label].append(instance_bbox(mask))
-        bboxes[label] = np.stack(bboxes[label], axis=0)
-    return bboxes
+    return {
+        label: _bboxes_vectorized(np.asarray(masks, dtype=bool))
+        for label, masks in instances_dict.items()
+    }
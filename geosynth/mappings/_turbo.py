@@ -275,5 +275,6 @@ def turbo(x: np.ndarray, min, max) -> np.ndarray:
 
         https://gist.github.com/mikhailov-work/ee72ba4191942acecc03fe6da94fc73f?permalink_comment_id=3122026#gistcomment-3122026
     """
+    x = x.astype(np.promote_types(x.dtype, np.float32), copy=False)  # e.g. float16
     x = x.clip(min, max) / max  # normalize to be in range [0, 1]
     return apply_palette(turbo_colormap_data_np, x)
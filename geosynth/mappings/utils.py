@@ -1,8 +1,54 @@
 import numpy as np
 
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
 
 def to_uint8(data: np.ndarray):
-    return np.clip(np.round(data * 255), 0, 255).astype(np.uint8)
+    """Convert float data in range ``[0, 1]`` to ``uint8`` in range ``[0, 255]``."""
+    data = np.asarray(data)
+    if numba is not None and data.dtype in (np.float32, np.float64):
+        flat = np.ascontiguousarray(data).reshape(-1)
+        out = np.empty(flat.shape, dtype=np.uint8)
+        _to_uint8_kernel(flat, out)
+        return out.reshape(data.shape)
+
+    # Single scratch buffer; every operation is performed in-place.
+    tmp = np.multiply(data, 255, dtype=np.promote_types(data.dtype, np.float32))
+    np.clip(tmp, 0, 255, out=tmp)
+    np.rint(tmp, out=tmp)
+    return tmp.astype(np.uint8)
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _to_uint8_kernel(data, out):
+        for i in numba.prange(data.shape[0]):
+            v = data[i] * np.float32(255.0)  # Don't promote float32 data.
+            if v != v:  # nan
+                out[i] = 0
+            else:
+                out[i] = np.uint8(round(min(max(v, 0.0), 255.0)))
+
+    @numba.njit(parallel=True, cache=True)
+    def _apply_palette_kernel(palette, data, out, scale):
+        n = palette.shape[0] - 1
+        for i in numba.prange(data.shape[0]):
+            v = data[i] * 255.0
+            if v != v:  # nan
+                for c in range(3):
+                    out[i, c] = 0
+                continue
+            a = min(max(int(v), 0), n)
+            b = min(a + 1, n)
+            f = v - a
+            for c in range(3):
+                px = palette[a, c] + (palette[b, c] - palette[a, c]) * f
+                px = min(max(px * scale, 0.0), 255.0)
+                out[i, c] = np.uint8(round(px))
 
 
 def apply_palette(palette: np.ndarray, data: np.ndarray) -> np.ndarray:
@@ -23,6 +69,16 @@ def apply_palette(palette: np.ndarray, data: np.ndarray) -> np.ndarray:
         Palette-applied data that has 1 dimensionality greater than ``data``.
         The last dimension is of length 3 and represents the mapped RGB value.
     """
+    if numba is not None:
+        palette = np.ascontiguousarray(palette, dtype=np.float64)
+        scale = 255.0 if palette.max() <= 1 else 1.0
+        if data.dtype != np.float64:
+            data = data.astype(np.float32, copy=False)
+        flat = np.ascontiguousarray(data).reshape(-1)
+        out = np.empty((flat.shape[0], 3), dtype=np.uint8)
+        _apply_palette_kernel(palette, flat, out, scale)
+        return out.reshape(*data.shape, 3)
+
     a = (data * 255).astype(np.uint8)
     b = (a + 1).clip(max=255)
     f = data * 255.0 - a
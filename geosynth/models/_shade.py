@@ -0,0 +1,103 @@
+"""Shading kernels operating on struct-of-arrays ``Lighting`` fields."""
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+
+if numba is not None:
+
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _accumulate_point_lights_kernel(positions, radiance, surface_xyz, normals, out):
+        for p in numba.prange(surface_xyz.shape[0]):
+            x, y, z = surface_xyz[p, 0], surface_xyz[p, 1], surface_xyz[p, 2]
+            nx, ny, nz = normals[p, 0], normals[p, 1], normals[p, 2]
+            r = g = b = np.float32(0.0)
+            for i in range(positions.shape[0]):
+                dx = positions[i, 0] - x
+                dy = positions[i, 1] - y
+                dz = positions[i, 2] - z
+                dist2 = dx * dx + dy * dy + dz * dz
+                if dist2 <= 0:
+                    continue
+                # ``n . l / dist^2`` with the un-normalized ``l``.
+                ndotl = (nx * dx + ny * dy + nz * dz) / (np.sqrt(dist2) * dist2)
+                ndotl = max(ndotl, np.float32(0.0))
+                r += radiance[i, 0] * ndotl
+                g += radiance[i, 1] * ndotl
+                b += radiance[i, 2] * ndotl
+            out[p, 0] += r
+            out[p, 1] += g
+            out[p, 2] += b
+
+
+def _accumulate_point_lights_numpy(positions, radiance, surface_xyz, normals, out):
+    for position, light_radiance in zip(positions, radiance):
+        d = position - surface_xyz
+        dist2 = np.einsum("ij,ij->i", d, d)
+        ndotl = np.einsum("ij,ij->i", normals, d)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ndotl /= np.sqrt(dist2) * dist2
+        ndotl[~(dist2 > 0)] = 0
+        np.maximum(ndotl, 0, out=ndotl)
+        out += ndotl[:, None] * light_radiance
+
+
+def accumulate_point_lights(
+    positions: np.ndarray,
+    colors: np.ndarray,
+    intensities: np.ndarray,
+    surface_xyz: np.ndarray,
+    normals: np.ndarray,
+    out: np.ndarray,
+) -> np.ndarray:
+    """Accumulate Lambertian irradiance from point lights with inverse-square falloff.
+
+    For every surface point ``x`` with normal ``n``, adds
+    ``color * intensity * max(n . l, 0) / |p - x|^2`` for each light at ``p``,
+    where ``l`` is the unit vector from ``x`` towards ``p``.
+
+    Parameters
+    ----------
+    positions: np.ndarray
+        (N, 3) light positions, e.g. ``Lighting.point_positions``.
+    colors: np.ndarray
+        (N, 3) light colors, e.g. ``Lighting.point_colors``.
+    intensities: np.ndarray
+        (N,) light intensities, e.g. ``Lighting.point_intensities``.
+    surface_xyz: np.ndarray
+        (..., 3) surface positions in the same coordinate system as ``positions``.
+    normals: np.ndarray
+        (..., 3) unit-norm surface normals.
+    out: np.ndarray
+        (..., 3) float32 array to accumulate into; modified in-place.
+
+    Returns
+    -------
+    np.ndarray
+        ``out``.
+    """
+    if surface_xyz.shape != normals.shape or surface_xyz.shape != out.shape:
+        raise ValueError("surface_xyz, normals, and out must have the same shape.")
+    if out.dtype != np.float32 or not out.flags.c_contiguous:
+        raise ValueError("out must be a C-contiguous float32 array.")
+
+    positions = np.ascontiguousarray(positions, dtype=np.float32)
+    radiance = np.ascontiguousarray(
+        colors * np.asarray(intensities)[:, None], dtype=np.float32
+    )
+    surface_xyz = np.ascontiguousarray(surface_xyz, dtype=np.float32).reshape(-1, 3)
+    normals = np.ascontiguousarray(normals, dtype=np.float32).reshape(-1, 3)
+    out_flat = out.reshape(-1, 3)  # view
+
+    if numba is not None:
+        _accumulate_point_lights_kernel(
+            positions, radiance, surface_xyz, normals, out_flat
+        )
+    else:
+        _accumulate_point_lights_numpy(
+            positions, radiance, surface_xyz, normals, out_flat
+        )
+    return out
@@ -1,60 +1,258 @@
-from typing import Any, List, Tuple, Union
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
-from pydantic import BaseModel, validator
 
-_Vector3 = Union[
-    np.ndarray,
-    Tuple[float, float, float],
-    List[float],
-]
+from ._shade import accumulate_point_lights
 
 
-class GeoSynthBaseModel(BaseModel):
-    class Config:
-        arbitrary_types_allowed = True
+def _to_float32(v: Any) -> np.ndarray:
+    return np.asarray(v, dtype=np.float32)
 
 
-class LightSource(GeoSynthBaseModel):
+@dataclass(eq=False)
+class LightSource:
+    __slots__ = ("color", "intensity")
+
     color: np.ndarray  # RGB in range [0, 1]
     intensity: float  # scalar in the range [0, 1].
 
-    @validator("color", pre=True)
-    def _validate_color_numpy(cls, v: _Vector3) -> np.ndarray:
-        return np.array(v, dtype=np.float32)
+    def __post_init__(self):
+        self.color = _to_float32(self.color)
+        self.intensity = float(self.intensity)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """Create from a dictionary, ignoring unknown keys."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
 
 
+@dataclass(eq=False)
 class AmbientLight(LightSource):
-    pass
+    __slots__ = ()
 
 
+@dataclass(eq=False)
 class PointLight(LightSource):
+    __slots__ = ("position",)
+
     position: np.ndarray  # (3,) xyz position in the camera's coordinate system in meters.
 
-    @validator("position", pre=True)
-    def _validate_position_numpy(cls, v: _Vector3) -> np.ndarray:
-        return np.array(v, dtype=np.float32)
+    def __post_init__(self):
+        super().__post_init__()
+        self.position = _to_float32(self.position)
 
 
+@dataclass(eq=False)
 class DirectionalLight(LightSource):
+    __slots__ = ("direction", "volume")
+
     direction: np.ndarray  # (3,) unit-norm xyz vector in the camera's coordinate system
     # (origin at light position)
     volume: np.ndarray  # (3, 3) un-normalized rotation matrix.
     # Row norm is axis length/scale in meters.
 
-    @validator("direction", pre=True)
-    def _validate_direction_numpy(cls, v: _Vector3) -> np.ndarray:
-        return np.array(v, dtype=np.float32)
+    def __post_init__(self):
+        super().__post_init__()
+        self.direction = _to_float32(self.direction)
+        self.volume = _to_float32(self.volume)
+        if self.volume.shape != (3, 3):
+            raise ValueError(
+                f"Expected volume to have shape (3, 3), got {self.volume.shape}."
+            )
+
+
+def _stack_field(lights: List[Any], field: str, shape: Tuple[int, ...]) -> np.ndarray:
+    """Stack ``field`` of all lights into a single ``(N, *shape)`` float32 array.
+
+    Each light may either be a dictionary or a light object.
+    """
+    values = [
+        light[field] if isinstance(light, dict) else getattr(light, field)
+        for light in lights
+    ]
+    arr = np.asarray(values, dtype=np.float32)
+    if arr.size == 0:
+        return arr.reshape((0, *shape))
+    if arr.shape[1:] != shape:
+        raise ValueError(
+            f'Expected light "{field}" to have shape {shape}, got {arr.shape[1:]}.'
+        )
+    return arr
 
-    @validator("volume", pre=True)
-    def _validate_volume_numpy(cls, v: Any) -> np.ndarray:
-        v = np.array(v, dtype=np.float32)
-        if v.shape != (3, 3):
-            raise ValueError
-        return v
 
+@dataclass(eq=False, init=False)
+class Lighting:
+    """Scene lighting.
+
+    Point and directional lights are stored column-wise (struct-of-arrays),
+    so that each field is a single contiguous array across all lights.
+    Lists of lights (``points`` and ``directionals``, e.g. as stored in
+    ``lighting.json``) are stacked into these arrays on construction.
+    """
+
+    __slots__ = (
+        "ambient",
+        "point_colors",
+        "point_intensities",
+        "point_positions",
+        "directional_colors",
+        "directional_intensities",
+        "directional_directions",
+        "directional_volumes",
+    )
 
-class Lighting(GeoSynthBaseModel):
     ambient: AmbientLight
-    points: List[PointLight]
-    directionals: List[DirectionalLight]
+
+    point_colors: np.ndarray  # (N, 3)
+    point_intensities: np.ndarray  # (N,)
+    point_positions: np.ndarray  # (N, 3)
+
+    directional_colors: np.ndarray  # (M, 3)
+    directional_intensities: np.ndarray  # (M,)
+    directional_directions: np.ndarray  # (M, 3)
+    directional_volumes: np.ndarray  # (M, 3, 3)
+
+    def __init__(
+        self,
+        ambient: Union[AmbientLight, Dict[str, Any]],
+        points: Optional[Sequence[Any]] = None,
+        directionals: Optional[Sequence[Any]] = None,
+        *,
+        point_colors: Any = None,
+        point_intensities: Any = None,
+        point_positions: Any = None,
+        directional_colors: Any = None,
+        directional_intensities: Any = None,
+        directional_directions: Any = None,
+        directional_volumes: Any = None,
+    ):
+        """Create scene lighting.
+
+        Each group of lights is specified either as a list of lights
+        (dictionaries or light objects), or as the corresponding arrays.
+
+        Parameters
+        ----------
+        ambient: Union[AmbientLight, Dict[str, Any]]
+            Ambient light.
+        points: Optional[Sequence[Any]]
+            Point lights. Mutually exclusive with the ``point_*`` arrays.
+        directionals: Optional[Sequence[Any]]
+            Directional lights. Mutually exclusive with the ``directional_*`` arrays.
+        """
+        if isinstance(ambient, dict):
+            ambient = AmbientLight.from_dict(ambient)
+        self.ambient = ambient
+
+        point_arrays = (point_colors, point_intensities, point_positions)
+        if points is not None:
+            if any(x is not None for x in point_arrays):
+                raise ValueError("Specify either points or point_* arrays, not both.")
+            point_arrays = (
+                _stack_field(points, "color", (3,)),
+                _stack_field(points, "intensity", ()),
+                _stack_field(points, "position", (3,)),
+            )
+        elif any(x is None for x in point_arrays):
+            raise TypeError("Lighting requires either points or all point_* arrays.")
+        (
+            self.point_colors,
+            self.point_intensities,
+            self.point_positions,
+        ) = (_to_float32(x) for x in point_arrays)
+
+        directional_arrays = (
+            directional_colors,
+            directional_intensities,
+            directional_directions,
+            directional_volumes,
+        )
+        if directionals is not None:
+            if any(x is not None for x in directional_arrays):
+                raise ValueError(
+                    "Specify either directionals or directional_* arrays, not both."
+                )
+            directional_arrays = (
+                _stack_field(directionals, "color", (3,)),
+                _stack_field(directionals, "intensity", ()),
+                _stack_field(directionals, "direction", (3,)),
+                _stack_field(directionals, "volume", (3, 3)),
+            )
+        elif any(x is None for x in directional_arrays):
+            raise TypeError(
+                "Lighting requires either directionals or all directional_* arrays."
+            )
+        (
+            self.directional_colors,
+            self.directional_intensities,
+            self.directional_directions,
+            self.directional_volumes,
+        ) = (_to_float32(x) for x in directional_arrays)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Lighting":
+        """Create from a dictionary (e.g. ``lighting.json``), ignoring unknown keys."""
+        names = {"ambient", "points", "directionals"} | {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+    @property
+    def points(self) -> Tuple[PointLight, ...]:
+        """Per-light views into the point light arrays.
+
+        Built on every access; to add or remove lights, create a new ``Lighting``.
+        """
+        return tuple(
+            PointLight(color=color, intensity=intensity, position=position)
+            for color, intensity, position in zip(
+                self.point_colors, self.point_intensities, self.point_positions
+            )
+        )
+
+    @property
+    def directionals(self) -> Tuple[DirectionalLight, ...]:
+        """Per-light views into the directional light arrays.
+
+        Built on every access; to add or remove lights, create a new ``Lighting``.
+        """
+        return tuple(
+            DirectionalLight(
+                color=color, intensity=intensity, direction=direction, volume=volume
+            )
+            for color, intensity, direction, volume in zip(
+                self.directional_colors,
+                self.directional_intensities,
+                self.directional_directions,
+                self.directional_volumes,
+            )
+        )
+
+    def point_irradiance(
+        self, surface_xyz: np.ndarray, normals: np.ndarray
+    ) -> np.ndarray:
+        """Lambertian irradiance from all point lights.
+
+        See ``geosynth.models._shade.accumulate_point_lights``.
+
+        Parameters
+        ----------
+        surface_xyz: np.ndarray
+            (..., 3) surface positions in the camera's coordinate system in meters.
+        normals: np.ndarray
+            (..., 3) unit-norm surface normals.
+
+        Returns
+        -------
+        np.ndarray
+            (..., 3) float32 RGB irradiance.
+        """
+        out = np.zeros(np.shape(surface_xyz), dtype=np.float32)
+        return accumulate_point_lights(
+            self.point_positions,
+            self.point_colors,
+            self.point_intensities,
+            surface_xyz,
+            normals,
+            out,
+        )
@@ -5,16 +5,15 @@ class UrlRetrieveProgressBar:
     def __init__(self, progress: Progress, message: str):
         self.progress = progress
         self.task_id = self.progress.add_task(message, start=False, total=None)
-        self.n_calls = 0
 
     def __call__(self, block_num, block_size, total_size):
-        self.n_calls += 1
-        if self.n_calls == 1:
-            self.update(total=total_size)
-            self.start()
-
-        downloaded = block_num * block_size
-        self.update(completed=downloaded)
+        # Only the first block sets the total and starts the task.
+        # ``__call__`` is looked up on the type, so swapping the class removes
+        # this setup from every subsequent call.
+        self.update(total=total_size)
+        self.start()
+        self.__class__ = _StartedUrlRetrieveProgressBar
+        self(block_num, block_size, total_size)
 
     def update(self, *args, **kwargs):
         return self.progress.update(self.task_id, *args, **kwargs)
@@ -32,3 +31,8 @@ class UrlRetrieveProgressBar:
 
     def reset(self, *args, **kwargs):
         self.progress.reset(self.task_id, *args, **kwargs)
+
+
+class _StartedUrlRetrieveProgressBar(UrlRetrieveProgressBar):
+    def __call__(self, block_num, block_size, total_size):
+        self.update(completed=block_num * block_size)
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Dict
 
 from geosynth.common import PathLike
 from geosynth.data import (
@@ -32,6 +33,8 @@ from geosynth.data import (
 class Scene:
     """Container for datatype readers for a single exemplar."""
 
+    __slots__ = ("path", "_readers")
+
     cube_environment_map: CubeEnvironmentMap
     depth: Depth
     extrinsics: Extrinsics
@@ -66,19 +69,22 @@ class Scene:
             Must contain a subfolder
         """
         self.path = Path(path)
+        # Bounded by the number of registered data types; readers only hold a path.
+        self._readers: Dict[str, Data] = {}
 
     def __getattr__(self, name) -> Data:
-        try:
-            # We could setattr here, but then memory-usage would increase over time.
-            return Data[name](self.path)
-        except KeyError as e:
-            raise AttributeError from e
+        if name.startswith("_"):
+            # Private/dunder lookups (e.g. ``_readers`` during unpickling)
+            # should never be interpreted as a data type.
+            raise AttributeError(name)
+        reader = self._readers.get(name)
+        if reader is None:
+            try:
+                cls = Data[name]
+            except KeyError as e:
+                raise AttributeError(name) from e
+            reader = self._readers[name] = cls(self.path)
+        return reader
 
     def __repr__(self):
-        keywords = ", ".join(
-            f"{key}={value!r}"
-            for key, value in self.__dict__.items()
-            if not key.startswith("_")
-        )
-        class_name = type(self).__name__
-        return f"{class_name}({keywords})"
+        return f"{type(self).__name__}(path={self.path!r})"
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from geosynth.mappings import utils
+from geosynth.mappings._turbo import turbo_colormap_data_np
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.random((48, 64), dtype=np.float32)
+
+
+@pytest.mark.parametrize("scale", [1, 255])
+def test_apply_palette_matches_numpy(data, scale, monkeypatch):
+    if utils.numba is None:
+        pytest.skip("numba not installed")
+    palette = turbo_colormap_data_np * scale
+    actual = utils.apply_palette(palette, data)
+    monkeypatch.setattr(utils, "numba", None)
+    expected = utils.apply_palette(palette, data)
+
+    assert actual.shape == (48, 64, 3)
+    assert actual.dtype == np.uint8
+    np.testing.assert_array_equal(actual, expected)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_to_uint8(data, dtype, monkeypatch):
+    data = data.astype(dtype) * 1.2 - 0.1  # Exercise clipping.
+    expected = np.clip(np.round(data * 255), 0, 255).astype(np.uint8)
+
+    np.testing.assert_array_equal(utils.to_uint8(data), expected)
+    monkeypatch.setattr(utils, "numba", None)
+    np.testing.assert_array_equal(utils.to_uint8(data), expected)
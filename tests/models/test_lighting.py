@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from geosynth.models.lighting import (
     AmbientLight,
@@ -116,4 +117,100 @@ def test_lighting_whole_model():
             },
         ],
     }
-    Lighting(**definition)
+    lighting = Lighting(**definition)
+
+    assert lighting.point_colors.shape == (2, 3)
+    assert lighting.point_intensities.shape == (2,)
+    assert lighting.point_positions.shape == (2, 3)
+    assert lighting.point_positions.dtype == np.float32
+
+    assert lighting.directional_colors.shape == (2, 3)
+    assert lighting.directional_intensities.shape == (2,)
+    assert lighting.directional_directions.shape == (2, 3)
+    assert lighting.directional_volumes.shape == (2, 3, 3)
+
+    assert len(lighting.points) == 2
+    np.testing.assert_allclose(
+        lighting.points[1].position, definition["points"][1]["position"]
+    )
+    assert len(lighting.directionals) == 2
+    np.testing.assert_allclose(
+        lighting.directionals[0].volume, definition["directionals"][0]["volume"]
+    )
+
+
+def test_point_light_no_copy():
+    position = np.array([1, 2, 3], dtype=np.float32)
+    light = PointLight(
+        color=(0.1, 0.2, 0.3),  # pyright: ignore[reportGeneralTypeIssues]
+        intensity=0.42,
+        position=position,
+    )
+    assert light.position is position
+
+
+def test_lighting_stack_lights():
+    ambient = {"color": (0.0, 0.0, 0.0), "intensity": 0.0}
+    point = PointLight(
+        color=(0.1, 0.2, 0.3),  # pyright: ignore[reportGeneralTypeIssues]
+        intensity=0.42,
+        position=(1, 2, 3),  # pyright: ignore[reportGeneralTypeIssues]
+    )
+    definition = {
+        "ambient": ambient,
+        "points": [
+            point,
+            {"color": (1, 1, 1), "intensity": 1.0, "position": (4, 5, 6)},
+        ],
+        "directionals": [],
+    }
+    lighting = Lighting.from_dict(definition)
+
+    np.testing.assert_array_equal(lighting.point_positions, [[1, 2, 3], [4, 5, 6]])
+    assert lighting.directional_colors.shape == (0, 3)
+    assert lighting.directional_intensities.shape == (0,)
+    assert lighting.directional_volumes.shape == (0, 3, 3)
+    assert lighting.directionals == ()
+
+
+def test_lighting_from_dict_ignores_extra_keys():
+    definition = {
+        "ambient": {"color": (0.0, 0.0, 0.0), "intensity": 0.0, "foo": 1},
+        "points": [
+            {"color": (1, 1, 1), "intensity": 1.0, "position": (4, 5, 6), "foo": 1}
+        ],
+        "directionals": [],
+        "version": 2,
+    }
+    lighting = Lighting.from_dict(definition)
+    np.testing.assert_array_equal(lighting.point_positions, [[4, 5, 6]])
+
+    light = PointLight.from_dict(definition["points"][0])
+    np.testing.assert_array_equal(light.position, [4, 5, 6])
+
+
+def test_lighting_arrays():
+    lighting = Lighting(
+        ambient=AmbientLight(
+            color=(0.0, 0.0, 0.0),  # pyright: ignore[reportGeneralTypeIssues]
+            intensity=0.0,
+        ),
+        point_colors=np.ones((2, 3)),
+        point_intensities=np.ones(2),
+        point_positions=np.zeros((2, 3)),
+        directionals=[],
+    )
+    assert lighting.point_colors.dtype == np.float32
+    assert len(lighting.points) == 2
+    assert lighting.directional_volumes.shape == (0, 3, 3)
+
+    with pytest.raises(ValueError):
+        Lighting(
+            ambient=lighting.ambient,
+            points=[],
+            point_colors=np.ones((0, 3)),
+            directionals=[],
+        )
+
+    with pytest.raises(TypeError):
+        Lighting(ambient=lighting.ambient, directionals=[])
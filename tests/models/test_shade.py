@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from geosynth.models import _shade
+from geosynth.models._shade import accumulate_point_lights
+
+
+@pytest.fixture
+def scene():
+    rng = np.random.default_rng(0)
+    positions = rng.uniform(-2, 2, (5, 3)).astype(np.float32)
+    colors = rng.uniform(0, 1, (5, 3)).astype(np.float32)
+    intensities = rng.uniform(0, 1, 5).astype(np.float32)
+    surface_xyz = rng.uniform(-2, 2, (12, 16, 3)).astype(np.float32)
+    normals = rng.normal(size=(12, 16, 3)).astype(np.float32)
+    normals /= np.linalg.norm(normals, axis=-1, keepdims=True)
+    return positions, colors, intensities, surface_xyz, normals
+
+
+def test_accumulate_point_lights_single_light():
+    out = np.ones((1, 3), dtype=np.float32)
+    accumulate_point_lights(
+        positions=np.array([[0, 0, 2]], dtype=np.float32),
+        colors=np.array([[1.0, 0.5, 0.0]], dtype=np.float32),
+        intensities=np.array([0.8], dtype=np.float32),
+        surface_xyz=np.zeros((1, 3), dtype=np.float32),
+        normals=np.array([[0, 0, 1]], dtype=np.float32),
+        out=out,
+    )
+    # 1 + color * intensity * cos(0) / 2^2
+    np.testing.assert_allclose(out, [[1.2, 1.1, 1.0]], rtol=1e-6)
+
+
+def test_accumulate_point_lights_backfacing():
+    out = np.zeros((1, 3), dtype=np.float32)
+    accumulate_point_lights(
+        positions=np.array([[0, 0, -2]], dtype=np.float32),
+        colors=np.ones((1, 3), dtype=np.float32),
+        intensities=np.ones(1, dtype=np.float32),
+        surface_xyz=np.zeros((1, 3), dtype=np.float32),
+        normals=np.array([[0, 0, 1]], dtype=np.float32),
+        out=out,
+    )
+    np.testing.assert_array_equal(out, 0)
+
+
+def test_accumulate_point_lights_matches_numpy(scene, monkeypatch):
+    if _shade.numba is None:
+        pytest.skip("numba not installed")
+    expected = accumulate_point_lights(
+        *scene, out=np.zeros(scene[3].shape, dtype=np.float32)
+    )
+    monkeypatch.setattr(_shade, "numba", None)
+    actual = accumulate_point_lights(
+        *scene, out=np.zeros(scene[3].shape, dtype=np.float32)
+    )
+    np.testing.assert_allclose(actual, expected, rtol=1e-4, atol=1e-6)
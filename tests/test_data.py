@@ -0,0 +1,131 @@
+import os
+import zipfile
+
+import numpy as np
+import pytest
+
+import geosynth.data
+from geosynth.data import Extrinsics, HdrMixin, HdrRgb, OpenEXR, Rgb, zstandard
+
+
+@pytest.fixture
+def extrinsics():
+    return np.arange(16, dtype=np.float64).reshape(4, 4)
+
+
+@pytest.mark.parametrize("compression", ["zstd", "deflate"])
+def test_npz_roundtrip(tmp_path, extrinsics, compression, monkeypatch):
+    if compression == "zstd" and zstandard is None:
+        pytest.skip("zstandard not installed")
+    monkeypatch.setattr(Extrinsics, "compression", compression)
+    fn = tmp_path / "extrinsics.npz"
+
+    Extrinsics.write_file(fn, extrinsics)
+    actual = Extrinsics.read_file(fn)
+    np.testing.assert_array_equal(actual, extrinsics)
+
+    Extrinsics.write_file(fn, {"foo": extrinsics, "bar": extrinsics[0]})
+    actual = Extrinsics.read_file(fn)
+    assert set(actual) == {"foo", "bar"}
+    np.testing.assert_array_equal(actual["foo"], extrinsics)
+    np.testing.assert_array_equal(actual["bar"], extrinsics[0])
+
+
+def test_npz_default_readable_by_numpy(tmp_path, extrinsics):
+    fn = tmp_path / "extrinsics.npz"
+
+    Extrinsics.write_file(fn, extrinsics)
+    with np.load(fn) as actual:
+        np.testing.assert_array_equal(actual["extrinsics"], extrinsics)
+
+
+def test_npz_write_zstd_opt_in(tmp_path, extrinsics):
+    if zstandard is None:
+        pytest.skip("zstandard not installed")
+    data = Extrinsics(tmp_path)
+
+    data.write(extrinsics, compression="zstd")
+    with zipfile.ZipFile(data.path) as zf:
+        assert zf.getinfo("extrinsics.npy").compress_type == zipfile.ZIP_STORED
+    np.testing.assert_array_equal(data.read(), extrinsics)
+
+
+def test_npz_write_zstd_not_installed(tmp_path, extrinsics, monkeypatch):
+    monkeypatch.setattr(geosynth.data, "zstandard", None)
+    with pytest.raises(ImportError):
+        Extrinsics.write_file(tmp_path / "extrinsics.npz", extrinsics, "zstd")
+
+
+def test_npz_read_legacy(tmp_path, extrinsics):
+    fn = tmp_path / "extrinsics.npz"
+    np.savez_compressed(fn, extrinsics=extrinsics)
+    np.testing.assert_array_equal(Extrinsics.read_file(fn), extrinsics)
+
+
+def test_npz_read_mmap(tmp_path, extrinsics):
+    fn = tmp_path / "extrinsics.npz"
+    np.savez(fn, foo=extrinsics, bar=np.asfortranarray(extrinsics))
+    actual = Extrinsics.read_file(fn, mmap=True)
+    assert isinstance(actual["foo"], np.memmap)
+    assert isinstance(actual["bar"], np.memmap)
+    np.testing.assert_array_equal(actual["foo"], extrinsics)
+    np.testing.assert_array_equal(actual["bar"], extrinsics)
+
+
+def test_npz_read_mmap_compressed(tmp_path, extrinsics):
+    fn = tmp_path / "extrinsics.npz"
+    np.savez_compressed(fn, extrinsics=extrinsics)
+    actual = Extrinsics.read_file(fn, mmap=True)
+    assert not isinstance(actual, np.memmap)
+    np.testing.assert_array_equal(actual, extrinsics)
+
+
+def test_exr_roundtrip(tmp_path):
+    if OpenEXR is None:
+        pytest.skip("OpenEXR not installed")
+    rgb = np.random.default_rng(0).uniform(0, 10, (8, 16, 3)).astype(np.float32)
+    hdr_rgb = HdrRgb(tmp_path)
+
+    hdr_rgb.write(rgb)
+    assert hdr_rgb.path == tmp_path / "hdr_rgb.exr"
+    actual = hdr_rgb.read()
+    assert actual.dtype == np.float32
+    np.testing.assert_array_equal(actual, rgb.astype(np.float16))
+
+    with OpenEXR.File(str(hdr_rgb.path)) as f:
+        assert f.header()["compression"] == OpenEXR.ZIP_COMPRESSION
+        assert f.channels()["RGB"].pixels.dtype == np.float16
+
+    # OpenCV's process-wide EXR codec setting must not be modified.
+    assert "OPENCV_IO_ENABLE_OPENEXR" not in os.environ
+
+
+def test_exr_write_clips_to_half_range(tmp_path):
+    if OpenEXR is None:
+        pytest.skip("OpenEXR not installed")
+    rgb = np.array([[[1.0, 1e5, -1e5]]], dtype=np.float32)
+    hdr_rgb = HdrRgb(tmp_path)
+
+    hdr_rgb.write(rgb)
+    actual = hdr_rgb.read()
+    assert np.isfinite(actual).all()
+    np.testing.assert_array_equal(actual, [[[1.0, 65504.0, -65504.0]]])
+
+
+def test_exr_read_legacy_hdr(tmp_path):
+    rgb = np.random.default_rng(0).uniform(0, 10, (8, 16, 3)).astype(np.float32)
+    HdrMixin.write_file(tmp_path / "hdr_rgb.hdr", rgb)
+    hdr_rgb = HdrRgb(tmp_path)
+
+    assert hdr_rgb.path == tmp_path / "hdr_rgb.hdr"
+    np.testing.assert_allclose(hdr_rgb.read(), rgb, atol=0.1)
+
+
+def test_png_rgba_roundtrip(tmp_path):
+    rgba = np.zeros((8, 16, 4), dtype=np.uint8)
+    rgba[...] = [1, 2, 3, 4]
+    fn = tmp_path / "rgb.png"
+
+    Rgb.write_file(fn, rgba)
+    np.testing.assert_array_equal(Rgb.read_file(fn), rgba)
+    np.testing.assert_array_equal(Rgb.read_file(fn, contiguous=False), rgba)
@@ -0,0 +1,96 @@
+import urllib.request
+import zipfile
+
+import pytest
+
+from geosynth import download
+from geosynth._download import _download_and_extract, _extract_zip
+from geosynth.data import Gravity
+
+
+@pytest.fixture
+def zip_path(tmp_path):
+    zip_path = tmp_path / "gravity.zip"
+    with zipfile.ZipFile(zip_path, "w") as f:
+        f.writestr("scene_0/", b"")
+        f.writestr("scene_0/gravity.npz", b"foo")
+        f.writestr("scene_1/nested/gravity.npz", b"bar")
+        f.writestr("../escaped_dir/", b"")
+        f.writestr("../escaped_parent/file.txt", b"baz")
+        f.writestr("/absolute/file.txt", b"qux")
+    return zip_path
+
+
+def test_download_invalid_dtype(tmp_path):
+    with pytest.raises(ValueError) as e:
+        download(tmp_path, ["rgb", "foo", "bar"])
+    assert str(e.value).startswith("Specified dtypes ['bar', 'foo'] are invalid.")
+    assert "'rgb'" in str(e.value)
+
+
+def test_extract_zip(tmp_path, zip_path):
+    dst = tmp_path / "dst"
+    _extract_zip(zip_path, dst)
+
+    assert (dst / "scene_0" / "gravity.npz").read_bytes() == b"foo"
+    assert (dst / "scene_1" / "nested" / "gravity.npz").read_bytes() == b"bar"
+
+    # Traversal and absolute members are extracted within ``dst``.
+    assert (dst / "escaped_dir").is_dir()
+    assert (dst / "escaped_parent" / "file.txt").read_bytes() == b"baz"
+    assert (dst / "absolute" / "file.txt").read_bytes() == b"qux"
+    assert not (tmp_path / "escaped_dir").exists()
+    assert not (tmp_path / "escaped_parent").exists()
+
+
+def test_extract_zip_symlink_outside(tmp_path, zip_path):
+    dst = tmp_path / "dst"
+    dst.mkdir()
+    (tmp_path / "outside").mkdir()
+    (dst / "scene_0").symlink_to(tmp_path / "outside")
+
+    with pytest.raises(ValueError, match="outside of"):
+        _extract_zip(zip_path, dst)
+    assert not list((tmp_path / "outside").iterdir())
+
+
+def test_download_and_extract_keep_zip(tmp_path, zip_path, monkeypatch):
+    dst = tmp_path / "dst"
+    monkeypatch.setattr(Gravity, "download_zip", lambda *args, **kwargs: zip_path)
+
+    _download_and_extract(
+        "gravity", dst, "demo", force=False, cleanup=False, progress_bar=None
+    )
+
+    assert (dst / "demo" / "scene_0" / "gravity.npz").read_bytes() == b"foo"
+    assert (dst / "demo" / "escaped_dir").is_dir()
+    assert not (dst / "escaped_dir").exists()
+    assert zip_path.exists()
+
+
+def test_download_cleanup_cached_zip(tmp_path, monkeypatch):
+    # Zip kept by a previous ``cleanup=False`` download.
+    variant_dir = tmp_path / "demo"
+    variant_dir.mkdir()
+    with zipfile.ZipFile(variant_dir / "gravity.zip", "w") as f:
+        f.writestr("scene_0/gravity.npz", b"foo")
+    monkeypatch.setattr(urllib.request, "urlopen", None)  # Must not download.
+    monkeypatch.setattr(urllib.request, "urlretrieve", None)
+
+    download(tmp_path, ["gravity"], variant="demo", cleanup=True)
+
+    assert (variant_dir / "scene_0" / "gravity.npz").read_bytes() == b"foo"
+    assert (variant_dir / "gravity.zip").stat().st_size == 0
+
+
+def test_download_duplicate_dtypes(tmp_path, monkeypatch):
+    calls = []
+
+    def download_and_extract_stream(output_dir, **kwargs):
+        calls.append(output_dir)
+
+    monkeypatch.setattr(
+        Gravity, "download_and_extract_stream", download_and_extract_stream
+    )
+    download(tmp_path, ["gravity", "gravity", "gravity"], variant="demo")
+    assert len(calls) == 1
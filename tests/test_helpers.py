@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from geosynth import helpers, instance_bbox, instance_segmentation_bboxes
+
+
+@pytest.fixture
+def masks():
+    masks = np.zeros((3, 48, 64), dtype=bool)
+    masks[0, 10:20, 30:40] = True
+    masks[1, 0, 0] = True
+    masks[1, 47, 63] = True
+    # masks[2] is intentionally empty.
+    return masks
+
+
+def test_instance_bbox(masks):
+    actual = instance_bbox(masks[0])
+    assert actual.dtype == np.float32
+    np.testing.assert_allclose(actual, [30 / 64, 10 / 48, 39 / 64, 19 / 48])
+
+
+def test_instance_bbox_empty(masks):
+    assert np.isnan(instance_bbox(masks[2])).all()
+
+
+def test_instance_segmentation_bboxes(masks):
+    actual = instance_segmentation_bboxes({"chair": masks, "table": masks[:1]})
+    assert set(actual) == {"chair", "table"}
+    assert actual["chair"].shape == (3, 4)
+    assert actual["chair"].dtype == np.float32
+    assert actual["table"].shape == (1, 4)
+
+    for mask, bbox in zip(masks, actual["chair"]):
+        np.testing.assert_array_equal(bbox, instance_bbox(mask))
+
+
+@pytest.mark.parametrize("shape", [(48, 64), (47, 61)])
+def test_first_last_nonzero_matches_numpy(shape, monkeypatch):
+    if helpers.numba is None:
+        pytest.skip("numba not installed")
+    rng = np.random.default_rng(0)
+    for threshold in (0.5, 0.99, 0.999, 1.0):
+        mask = rng.random(shape) > threshold
+        for axis in (0, 1):
+            actual = helpers._first_last_nonzero(mask, axis)
+            with monkeypatch.context() as m:
+                m.setattr(helpers, "numba", None)
+                expected = helpers._first_last_nonzero(mask, axis)
+            if expected is None:
+                assert actual is None
+            else:
+                assert tuple(actual) == tuple(expected)
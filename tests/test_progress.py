@@ -0,0 +1,20 @@
+from rich.progress import Progress
+
+from geosynth.progress import UrlRetrieveProgressBar
+
+
+def test_url_retrieve_progress_bar():
+    progress = Progress(disable=True)
+    bar = UrlRetrieveProgressBar(progress, "foo downloading")
+    task = progress.tasks[0]
+    assert not task.started
+
+    bar(0, 10, 100)
+    assert task.started
+    assert task.total == 100
+    assert task.completed == 0
+
+    bar(3, 10, 100)
+    assert isinstance(bar, UrlRetrieveProgressBar)
+    assert task.total == 100
+    assert task.completed == 30
@@ -6,9 +6,10 @@ from geosynth import Scene
 from geosynth.data import Rgb
 
 
-@pytest.fixture
-def tmp_scene_folder(tmp_path):
-    root = tmp_path / "scene_id"
+@pytest.fixture(scope="session")
+def tmp_scene_folder(tmp_path_factory):
+    # Read-only; shared across tests.
+    root = tmp_path_factory.mktemp("scenes") / "scene_id"
     root.mkdir()
 
     img = np.zeros((48, 64, 3), dtype=np.uint8)
@@ -19,7 +20,7 @@ def tmp_scene_folder(tmp_path):
 
     def npz_save(name, data):
         kwargs = {name: data}
-        np.savez_compressed(root / f"{name}.npz", **kwargs)
+        np.savez(root / f"{name}.npz", **kwargs)
 
     npz_save("depth", np.ones((64, 48)).astype(np.float16))
     npz_save(
@@ -35,10 +36,33 @@ def test_scene_basic(tmp_scene_folder):
 
     rgb = scene.rgb.read()
     assert rgb.shape == (48, 64, 3)
+    assert rgb.flags.c_contiguous
+    assert (rgb[0, 0] == [1, 2, 3]).all()
+    cv2.rectangle(rgb, (0, 0), (10, 10), (0, 255, 0))  # Must be drawable.
+
+    rgb = scene.rgb.read(contiguous=False)
+    assert rgb.shape == (48, 64, 3)
+    assert (rgb[0, 0] == [1, 2, 3]).all()
 
     depth = scene.depth.read()
+    assert depth.dtype == np.float16
+
+    depth = scene.depth.read(dtype=np.float32)
     assert depth.dtype == np.float32
 
     intrinsics = scene.intrinsics.read()
     assert intrinsics.shape == (3, 3)
     assert intrinsics.dtype == float
+
+
+def test_scene_reader_cache(tmp_scene_folder):
+    scene = Scene(tmp_scene_folder)
+    assert scene.rgb is scene.rgb
+
+    with pytest.raises(AttributeError):
+        scene.not_a_data_type  # noqa: B018
+
+
+def test_scene_repr(tmp_scene_folder):
+    scene = Scene(tmp_scene_folder)
+    assert repr(scene) == f"Scene(path={tmp_scene_folder!r})"
@@ -0,0 +1,110 @@
+import io
+import zipfile
+
+import pytest
+
+from geosynth._stream_unzip import StreamUnzipError, stream_unzip
+
+_MEMBERS = {
+    "scene_0/": b"",
+    "scene_0/gravity.npz": b"foo" * 1000,
+    "scene_1/gravity.npz": bytes(range(256)) * 100,
+    "scene_1/empty.npz": b"",
+}
+
+
+class _NonSeekable(io.RawIOBase):
+    """Write-only stream that forces ``zipfile`` to emit data descriptors."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.buffer += b
+        return len(b)
+
+
+def _make_zip(compression, seekable=True, force_zip64=False) -> bytes:
+    fileobj = io.BytesIO() if seekable else _NonSeekable()
+
+    with zipfile.ZipFile(fileobj, "w", compression=compression) as f:
+        for name, data in _MEMBERS.items():
+            if name.endswith("/"):
+                f.writestr(name, data)
+                continue
+            with f.open(name, "w", force_zip64=force_zip64) as member:
+                member.write(data)
+
+    if seekable:
+        return fileobj.getvalue()  # pyright: ignore[reportGeneralTypeIssues]
+    else:
+        return bytes(fileobj.buffer)  # pyright: ignore[reportGeneralTypeIssues]
+
+
+def _extract(data: bytes, chunk_size=1 << 16):
+    return {
+        name: b"".join(chunks)
+        for name, chunks in stream_unzip(io.BytesIO(data), chunk_size=chunk_size)
+    }
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+@pytest.mark.parametrize("force_zip64", [False, True])
+def test_stream_unzip(compression, force_zip64):
+    data = _make_zip(compression, force_zip64=force_zip64)
+    assert _extract(data, chunk_size=7) == _MEMBERS
+
+
+@pytest.mark.parametrize("force_zip64", [False, True])
+def test_stream_unzip_data_descriptor(force_zip64):
+    data = _make_zip(zipfile.ZIP_DEFLATED, seekable=False, force_zip64=force_zip64)
+    assert _extract(data, chunk_size=7) == _MEMBERS
+
+
+def test_stream_unzip_stored_data_descriptor():
+    data = _make_zip(zipfile.ZIP_STORED, seekable=False)
+    with pytest.raises(StreamUnzipError):
+        _extract(data)
+
+
+def test_stream_unzip_sanitize_name():
+    fileobj = io.BytesIO()
+    with zipfile.ZipFile(fileobj, "w") as f:
+        f.writestr("../../evil.txt", b"foo")
+        f.writestr("/abs/path.txt", b"bar")
+    assert _extract(fileobj.getvalue()) == {
+        "evil.txt": b"foo",
+        "abs/path.txt": b"bar",
+    }
+
+
+def test_stream_unzip_bad_crc():
+    data = bytearray(_make_zip(zipfile.ZIP_STORED))
+    index = data.index(b"foofoo")
+    data[index] = ord("g")
+    with pytest.raises(StreamUnzipError):
+        _extract(bytes(data))
+
+
+def test_stream_unzip_empty_archive():
+    fileobj = io.BytesIO()
+    with zipfile.ZipFile(fileobj, "w"):
+        pass
+    assert _extract(fileobj.getvalue()) == {}
+
+
+@pytest.mark.parametrize("offset", [0, 10])
+def test_stream_unzip_truncated(offset):
+    data = _make_zip(zipfile.ZIP_DEFLATED)
+    # Cut the archive at (or into) the second member's local header.
+    second_header = data.index(b"PK\x03\x04", 1)
+    with pytest.raises(StreamUnzipError):
+        _extract(data[: second_header + offset])
+
+
+def test_stream_unzip_truncated_empty():
+    with pytest.raises(StreamUnzipError):
+        _extract(b"")
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from geosynth._visualize_instances import visualize_instances
+
+
+@pytest.fixture
+def instances_dict():
+    masks = np.zeros((2, 48, 64), dtype=bool)
+    masks[0, 5:20, 40:60] = True
+    masks[1, 10:40, 2:50] = True
+    return {"chair": masks[:1], "table": masks[1:]}
+
+
+def test_visualize_instances_cv2(instances_dict):
+    rgb = np.full((48, 64, 3), 128, dtype=np.uint8)
+    viz = visualize_instances(instances_dict, rgb=rgb)
+    assert viz.shape == (48, 64, 3)
+    assert viz.dtype == np.uint8
+    assert (rgb == 128).all()  # input is not modified.
+    assert (viz[45, 60] == 128).all()  # not covered by any instance.
+    assert (viz[30, 25] != 128).any()  # covered by "table" mask.
+
+
+@pytest.mark.parametrize("kwargs", [{"dpi": 100}, {"show": True}])
+def test_visualize_instances_cv2_matplotlib_only_options(instances_dict, kwargs):
+    with pytest.raises(ValueError, match="matplotlib"):
+        visualize_instances(instances_dict, **kwargs)
+
+
+def test_visualize_instances_invalid_backend(instances_dict):
+    with pytest.raises(ValueError):
+        visualize_instances(instances_dict, backend="foo")
+
+
+def test_visualize_instances_matplotlib():
+    pytest.importorskip("matplotlib")
+    masks = np.zeros((1, 40, 100), dtype=bool)
+    masks[0, 10:35, 2:50] = True
+
+    viz = visualize_instances({"table": masks}, dpi=100, backend="matplotlib")
+    # Default 6.4in wide figure at 100 dpi, preserving the 5:2 aspect ratio.
+    assert viz.shape == (256, 640, 3)
+    assert viz.dtype == np.uint8
+
+    # Bbox edges are drawn in green.
+    green = (viz[..., 1] > 200) & (viz[..., 0] < 80) & (viz[..., 2] < 80)
+    # Pixel centers of the bbox's left column (2) and bottom row (34).
+    scale = viz.shape[1] / masks.shape[2]
+    left, bottom = round(2.5 * scale), round(34.5 * scale)
+    assert green[:, left - 2 : left + 3].sum(axis=0).max() > 20 * scale
+    assert green[bottom - 2 : bottom + 3].sum(axis=1).max() > 40 * scale
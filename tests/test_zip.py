@@ -1,4 +1,7 @@
 import filecmp
+import io
+import urllib.error
+import urllib.request
 import zipfile
 from pathlib import Path
 
@@ -21,3 +24,69 @@ def test_download_zip_invalid_variant(tmp_path):
         str(e.value)
         == "Variant \"foobar\" not in valid. Choose one of: ['demo', 'full']."
     )
+
+
+def test_download_and_extract_stream(tmp_path, monkeypatch):
+    zip_bytes = io.BytesIO()
+    with zipfile.ZipFile(zip_bytes, "w", compression=zipfile.ZIP_DEFLATED) as f:
+        f.writestr("scene_0/gravity.npz", b"foo")
+        f.writestr("scene_1/gravity.npz", b"bar")
+
+    class Response(io.BytesIO):
+        headers = {"Content-Length": str(len(zip_bytes.getvalue()))}
+
+    monkeypatch.setattr(
+        urllib.request, "urlopen", lambda url: Response(zip_bytes.getvalue())
+    )
+
+    output_dir = Gravity.download_and_extract_stream(tmp_path, variant="demo")
+    assert output_dir == tmp_path / "demo"
+    assert (output_dir / "scene_0" / "gravity.npz").read_bytes() == b"foo"
+    assert (output_dir / "scene_1" / "gravity.npz").read_bytes() == b"bar"
+
+    # Empty placeholder zip prevents subsequent downloads.
+    assert (output_dir / "gravity.zip").stat().st_size == 0
+    monkeypatch.setattr(urllib.request, "urlopen", None)
+    Gravity.download_and_extract_stream(tmp_path, variant="demo")
+
+
+def test_download_and_extract_stream_truncated(tmp_path, monkeypatch):
+    zip_bytes = io.BytesIO()
+    with zipfile.ZipFile(zip_bytes, "w", compression=zipfile.ZIP_DEFLATED) as f:
+        f.writestr("scene_0/gravity.npz", b"foo")
+    data = zip_bytes.getvalue()
+
+    class Response(io.BytesIO):
+        # Server advertises more data than it sends (e.g. dropped connection).
+        headers = {"Content-Length": str(len(data) + 100)}
+
+    monkeypatch.setattr(urllib.request, "urlopen", lambda url: Response(data))
+
+    with pytest.raises(urllib.error.ContentTooShortError):
+        Gravity.download_and_extract_stream(tmp_path, variant="demo")
+
+    # Not marked as complete, so the next call re-downloads.
+    assert not (tmp_path / "demo" / "gravity.zip").exists()
+
+
+def test_download_and_extract_stream_progress(tmp_path, monkeypatch):
+    zip_bytes = io.BytesIO()
+    with zipfile.ZipFile(zip_bytes, "w", compression=zipfile.ZIP_DEFLATED) as f:
+        for i in range(200):
+            f.writestr(f"scene_{i}/gravity.npz", bytes(range(256)) * 4)
+    data = zip_bytes.getvalue()
+
+    class Response(io.BytesIO):
+        headers = {"Content-Length": str(len(data))}
+
+    monkeypatch.setattr(urllib.request, "urlopen", lambda url: Response(data))
+
+    completed = []
+
+    def reporthook(block_num, block_size, total_size):
+        assert total_size == len(data)
+        completed.append(block_num * block_size)
+
+    Gravity.download_and_extract_stream(tmp_path, variant="demo", reporthook=reporthook)
+    assert completed == sorted(completed)
+    assert completed[-1] == len(data)